@@ -1,10 +1,10 @@
 import json
 import os
 import re
-import frontmatter
+import functools
 from pathlib import Path
-from bs4 import BeautifulSoup
-from html.parser import HTMLParser
+from concurrent.futures import ProcessPoolExecutor
+from lxml import etree, html as lxml_html
 
 # --- CONFIGURATION ---
 BASE_DIR = Path(__file__).resolve().parent
@@ -17,189 +17,115 @@ VERSION = "0.0.1"
 SCHEME_URI = f"{DOMAIN}/{VERSION}/concept-scheme/"
 ROOT_UUID = "https://vernacular.cloud/0.0.1/nU2JNEcOO9ZHxSlpZMwbCgOG/"
 
-# --- FORMATTER CLASS (From your snippet) ---
-class SmartHTMLFormatter(HTMLParser):
-    def __init__(self, indent_width=2):
-        super().__init__()
-        self.indent_width = indent_width
-        self.level = 0
-        self.formatted = []
-        
-        self.structural_tags = {
-            'html', 'head', 'body', 'header', 'footer', 'main', 'aside', 
-            'section', 'div', 'ul', 'ol', 'script', 'style', 'meta', 'link'
-        }
-        
-        self.content_tags = {
-            'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'li', 'title', 'blockquote', 'small'
-        }
-        
-        self.void_tags = {'meta', 'link', 'img', 'br', 'hr', 'input'}
-        self.just_opened_block = False
-
-    def _add_newline_if_needed(self):
-        if self.formatted and not self.formatted[-1].endswith('\n'):
-            self.formatted.append('\n')
-
-    def _indent(self):
-        self.formatted.append(' ' * (self.level * self.indent_width))
-
-    def handle_starttag(self, tag, attrs):
-        if tag in self.structural_tags:
-            self._add_newline_if_needed()
-            self._indent()
-            attr_str = ''.join(f' {k}="{v}"' if v else f' {k}' for k, v in attrs)
-            self.formatted.append(f"<{tag}{attr_str}>")
-            if tag not in self.void_tags:
-                self.level += 1
-                self.just_opened_block = True
-
-        elif tag in self.content_tags:
-            self._add_newline_if_needed()
-            self._indent()
-            attr_str = ''.join(f' {k}="{v}"' if v else f' {k}' for k, v in attrs)
-            self.formatted.append(f"<{tag}{attr_str}>")
-            self.just_opened_block = True
-            
-        else:
-            attr_str = ''.join(f' {k}="{v}"' if v else f' {k}' for k, v in attrs)
-            self.formatted.append(f"<{tag}{attr_str}>")
-            self.just_opened_block = False
-
-    def handle_endtag(self, tag):
-        if tag in self.structural_tags:
-            if tag not in self.void_tags:
-                self.level -= 1
-                self._add_newline_if_needed()
-                self._indent()
-            self.formatted.append(f"</{tag}>")
-            self.just_opened_block = False
-
-        elif tag in self.content_tags:
-            if self.formatted and self.formatted[-1].endswith('\n'):
-                 self._indent()
-            self.formatted.append(f"</{tag}>")
-            self.just_opened_block = False
-
-        else:
-            self.formatted.append(f"</{tag}>")
-
-    def handle_data(self, data):
-        stripped = data.strip()
-        
-        # MODIFIED CHECK:
-        # If stripped is empty, we usually discard it.
-        # BUT, if 'data' contains a non-breaking space (\xa0), we must keep it.
-        if not stripped and '\xa0' not in data: 
-            return
-
-        if self.just_opened_block and self.formatted and self.formatted[-1].endswith('>'):
-             pass
-
-        self.formatted.append(data)
-        self.just_opened_block = False    
-        
-    def handle_decl(self, decl):
-        self.formatted.append(f"<!{decl}>\n")
-
-    def handle_comment(self, data):
-        self._add_newline_if_needed()
-        self._indent()
-        self.formatted.append(f"") # Restored comment syntax
-        
-def prettify_html(html_content):
-    formatter = SmartHTMLFormatter(indent_width=2)
-    formatter.feed(html_content)
-    output = "".join(formatter.formatted)
-    return re.sub(r'\n\s*\n', '\n', output)
+# --- PRECOMPILED PATTERNS ---
+WIKI_RE = re.compile(r'\[\[(.*?)\]\]')
+HEADER_RE = re.compile(r'^#+[ \t]+(.*)$', re.MULTILINE)
+FRONTMATTER_RE = re.compile(r'\A---[ \t]*\r?\n(.*?)^---[ \t]*\r?$\n?', re.DOTALL | re.MULTILINE)
+META_LINE_RE = re.compile(r'^([\w-]+):[ \t]*(.*?)[ \t]*$', re.MULTILINE)
+SCRIPT_RE = re.compile(
+    r'(<script\b[^>]*\btype=["\']?application/ld\+json["\']?[^>]*>)(.*?)(</script\s*>)',
+    re.DOTALL | re.IGNORECASE
+)
+
+# --- PRECOMPILED XPATHS ---
+MAIN_XPATH = etree.XPath("(//main)[1]")
+SECTIONS_XPATH = etree.XPath(".//section")
+# The concept link: first <a> in the first <h1> of the section's first <header>.
+# Walked step by step so a grouping section with an unlinked heading doesn't
+# borrow the link of a concept nested inside it.
+PARENT_LINK_XPATH = etree.XPath("(.//header)[1]/descendant::h1[1]/descendant::a[1]")
+# href of the first link in each direct <p> child (one narrower concept per paragraph)
+CHILD_HREFS_XPATH = etree.XPath("./p/descendant::a[1]/@href", smart_strings=False)
 
 # --- LOGIC ---
 
+def fast_load(file_path):
+    """
+    Reads a note and returns (metadata, content) without a full YAML parse.
+    Only flat 'key: value' lines are picked up (concept-key, top-concept);
+    surrounding quotes are dropped and nested YAML is ignored.
+    """
+    data = Path(file_path).read_text(encoding="utf-8")
+    match = FRONTMATTER_RE.match(data)
+    if not match:
+        return {}, data
+    metadata = {key: value.strip('\'"') for key, value in META_LINE_RE.findall(match.group(1))}
+    return metadata, data[match.end():]
+
 def normalize_text(text_lines):
     if not text_lines: return None
-    text = " ".join(line.strip() for line in text_lines if line.strip())
-    text = re.sub(r'\[\[(.*?)\]\]', r'\1', text) 
+    stripped_lines = (line.strip() for line in text_lines)
+    text = " ".join(line for line in stripped_lines if line)
+    text = WIKI_RE.sub(r'\1', text)
     return text
 
 def parse_definition_from_md(content):
-    lines = content.split('\n')
-    capturing = False
-    definition_lines = []
-    for line in lines:
-        header_match = re.match(r'^#+\s+(.*)', line)
-        if header_match:
-            if header_match.group(1).strip().lower() == "definition":
-                capturing = True
-                continue
-            elif capturing:
-                break
-        if capturing:
-            definition_lines.append(line)
-    return normalize_text(definition_lines)
+    # parts alternates [preamble, header1, body1, header2, body2, ...]
+    parts = HEADER_RE.split(content)
+    for i in range(1, len(parts), 2):
+        if parts[i].strip().casefold() == "definition":
+            return normalize_text(parts[i + 1].splitlines())
+    return None
+
+def _load_definition(file_path):
+    """Returns (uuid, definition) for one note. Top-level so worker processes can pickle it."""
+    try:
+        metadata, content = fast_load(file_path)
+        uuid = metadata.get('concept-key')
+        if uuid:
+            return uuid, parse_definition_from_md(content)
+    except Exception: pass
+    return None, None
 
 def build_definition_map(source_dir):
     print(f"📂 Scanning Markdown files in {source_dir}...")
-    def_map = {}
     source_path = Path(source_dir)
     if not source_path.exists():
         return {}
-    for file_path in source_path.glob("*.md"):
-        try:
-            post = frontmatter.load(file_path)
-            uuid = post.metadata.get('concept-key')
-            if uuid:
-                definition = parse_definition_from_md(post.content)
-                if definition:
-                    def_map[uuid] = definition
-        except Exception: pass
+    # Each note is read independently, so fan the file reads, front-matter split and
+    # Definition extraction out over all cores
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(_load_definition, source_path.glob("*.md"), chunksize=16)
+        def_map = {uuid: definition for uuid, definition in results if uuid and definition}
     print(f"✅ Indexed {len(def_map)} definitions.")
     return def_map
 
+@functools.lru_cache(maxsize=None)
 def extract_uuid_from_url(url):
     parts = url.strip('/').split('/')
     return parts[-1] if parts else None
 
+@functools.lru_cache(maxsize=None)
 def make_absolute(url):
     if url.startswith("http"): return url
     if url.startswith("/"): return f"{DOMAIN}{url}"
     return f"{DOMAIN}/{url}"
 
 def inject_into_html(json_data, html_path):
-    """Finds the script tag, replaces content, and formats HTML."""
+    """Finds the script tag and replaces its content in place."""
     print(f"💉 Injecting JSON-LD into {html_path}...")
     
     with open(html_path, "r", encoding="utf-8") as f:
-#        soup = BeautifulSoup(f, "html.parser")
-        soup = BeautifulSoup(f, "html5lib")
-#        soup = BeautifulSoup(f, "lxml")        
+        html = f.read()
 
-
-    # Find the JSON-LD script tag
-    script_tag = soup.find("script", {"type": "application/ld+json"})
+    # 1. Generate standard JSON
+    raw_json = json.dumps(json_data, indent=2)
     
-    if script_tag:
-        # 1. Generate standard JSON
-        raw_json = json.dumps(json_data, indent=2)
-        
-        # 2. Add 6-space indentation to EVERY line
-        # We split the JSON by newlines, add the spaces, and rejoin them
-        indentation = " " * 6
-        indented_json = "\n".join(indentation + line for line in raw_json.split("\n"))
-        
-        # 3. Set the content: Newline + Indented Block + Newline + (Optional alignment for closing tag)
-        script_tag.string = f"\n{indented_json}\n"
-        
-        # 4. Get raw HTML string from BeautifulSoup
-        # raw_html = str(soup)
-        raw_html = soup.encode(formatter="html").decode("utf-8")
-        
-        # 5. Run it through SmartHTMLFormatter
-        final_html = prettify_html(raw_html)
-        
-        # 6. Write back to file
-        with open(html_path, "w", encoding="utf-8") as f:
-            f.write(final_html)
-        print(f"✅ Injection and formatting successful.")
+    # 2. Add 6-space indentation to EVERY line
+    # We split the JSON by newlines, add the spaces, and rejoin them
+    indentation = " " * 6
+    indented_json = "\n".join(indentation + line for line in raw_json.split("\n"))
+    
+    # 3. Splice it between the existing tags; the rest of the page is left
+    #    byte-for-byte as it was, so no reparse or reformat is needed
+    final_html, found = SCRIPT_RE.subn(
+        lambda m: f"{m.group(1)}\n{indented_json}\n    {m.group(3)}", html, count=1
+    )
+    
+    if found:
+        # 4. Write back to file (encoded in one call, no text-layer buffering)
+        Path(html_path).write_bytes(final_html.encode("utf-8"))
+        print(f"✅ Injection successful.")
     else:
         print("❌ Error: <script type='application/ld+json'> tag not found in HTML.")
 
@@ -210,28 +136,24 @@ def generate_full_jsonld():
         print(f"❌ HTML file not found: {HTML_FILE}")
         return
 
-    with open(HTML_FILE, "r", encoding="utf-8") as f:
-        soup = BeautifulSoup(f, "html.parser")
+    tree = lxml_html.parse(str(HTML_FILE), parser=lxml_html.HTMLParser(encoding="utf-8"))
 
     graph_map = {} 
-    main_area = soup.find("main")
-    if not main_area: return
-
-    sections = main_area.find_all("section", recursive=True)
-
-    for section in sections:
-        header = section.find("header")
-        if not header: continue
-        h1 = header.find("h1")
-        if not h1: continue
-        parent_link = h1.find("a")
-        if not parent_link: continue
-
-        parent_uri = make_absolute(parent_link['href'])
-        parent_uuid = extract_uuid_from_url(parent_link['href'])
+    # { parent_uri: {narrower_uri: None} } -- a dict doubles as an insertion-ordered set
+    narrower_sets = {}
+    main_areas = MAIN_XPATH(tree)
+    if not main_areas: return
+
+    for section in SECTIONS_XPATH(main_areas[0]):
+        parent_links = PARENT_LINK_XPATH(section)
+        if not parent_links: continue
+        parent_link = parent_links[0]
+
+        parent_uri = make_absolute(parent_link.get('href'))
+        parent_uuid = extract_uuid_from_url(parent_link.get('href'))
         
         # Handle Visible Label vs Data Attribute (PrefLabel)
-        visible_text = parent_link.get_text(strip=True)
+        visible_text = "".join(text.strip() for text in parent_link.itertext())
         hidden_pref = parent_link.get('data-pref-label')
         
         if hidden_pref:
@@ -241,19 +163,10 @@ def generate_full_jsonld():
             final_pref_label = visible_text
             final_alt_label = None
         
-        narrower_uris = []
-        paragraphs = section.find_all("p", recursive=False)
-        for p in paragraphs:
-            child_link = p.find("a")
-            if child_link and child_link.get("href"):
-                child_uri = make_absolute(child_link['href'])
-                narrower_uris.append(child_uri)
+        narrower_uris = [make_absolute(href) for href in CHILD_HREFS_XPATH(section) if href]
 
         if parent_uri in graph_map:
-            if narrower_uris:
-                existing = graph_map[parent_uri].get("skos:narrower", [])
-                combined = list(set(existing + narrower_uris))
-                graph_map[parent_uri]["skos:narrower"] = combined
+            narrower_sets[parent_uri].update(dict.fromkeys(narrower_uris))
         else:
             concept_obj = {
                 "@id": parent_uri,
@@ -267,10 +180,13 @@ def generate_full_jsonld():
 
             if parent_uuid and parent_uuid in definition_map:
                 concept_obj["skos:definition"] = definition_map[parent_uuid]
-            if narrower_uris:
-                concept_obj["skos:narrower"] = narrower_uris
             
             graph_map[parent_uri] = concept_obj
+            narrower_sets[parent_uri] = dict.fromkeys(narrower_uris)
+
+    for parent_uri, narrower in narrower_sets.items():
+        if narrower:
+            graph_map[parent_uri]["skos:narrower"] = list(narrower)
 
     full_json_ld = {
         "@context": {
@@ -280,7 +196,7 @@ def generate_full_jsonld():
         "@graph": list(graph_map.values())
     }
 
-    # TRIGGER INJECTION AND FORMATTING
+    # TRIGGER INJECTION
     inject_into_html(full_json_ld, HTML_FILE)
 
 if __name__ == "__main__":
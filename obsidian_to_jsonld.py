@@ -1,10 +1,19 @@
 import os
 import re
+import io
 import json
-import frontmatter
+import hashlib
+import functools
+import itertools
+import unicodedata
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
-from html.parser import HTMLParser
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
+
+try:
+    import orjson  # Optional: C serializer for the per-page JSON-LD
+except ImportError:
+    orjson = None
 
 # --- CONFIGURATION ---
 BASE_DIR = Path(__file__).resolve().parent
@@ -12,211 +21,203 @@ BASE_DIR = Path(__file__).resolve().parent
 SOURCE_DIR = BASE_DIR / "../../../Dropbox/docs/Knowledge Mgt/Obsidian markdown/VernacularCloud"
 OUTPUT_DIR = BASE_DIR / "../../html/vernacular-cloud-003/0.0.1"
 TEMPLATE_DIR = BASE_DIR / "templates"
+# Lives in OUTPUT_DIR; records what each page was last built from
+BUILD_CACHE_NAME = ".build_cache.json"
 
 VERSION = "0.0.1"
 DOMAIN = "https://vernacular.cloud"
-
-# Mapping Markdown Headers to SKOS properties
-HEADER_TO_SKOS = {
-    "Definition": "skos:definition",
-    "Broader": "skos:broader",
-    "Narrower": "skos:narrower",
-    "Related": "skos:related",
-    "Alternative Label": "skos:altLabel",
-    "Editorial Note": "skos:editorialNote",
-    "History Note": "skos:historyNote",
-    "Scope Note": "skos:scopeNote",
-    "Example": "skos:example"
+CONCEPT_URI_PREFIX = f"{DOMAIN}/{VERSION}/"
+SCHEME_URI = f"{CONCEPT_URI_PREFIX}concept-scheme/"
+# Site-relative prefix for links between concept pages
+INTERNAL_LINK_PREFIX = f"/{VERSION}/"
+
+# How a section's lines become a SKOS value
+KIND_URIS = 0    # linked concepts -> URI, or list of URIs
+KIND_LABELS = 1  # one label per line -> list
+KIND_TEXT = 2    # lines joined into one string
+
+# Mapping Markdown Headers to (SKOS property, kind)
+HEADER_SPEC = {
+    "Definition": ("skos:definition", KIND_TEXT),
+    "Broader": ("skos:broader", KIND_URIS),
+    "Narrower": ("skos:narrower", KIND_URIS),
+    "Related": ("skos:related", KIND_URIS),
+    "Alternative Label": ("skos:altLabel", KIND_LABELS),
+    "Editorial Note": ("skos:editorialNote", KIND_TEXT),
+    "History Note": ("skos:historyNote", KIND_TEXT),
+    "Scope Note": ("skos:scopeNote", KIND_TEXT),
+    "Example": ("skos:example", KIND_TEXT)
 }
 
+# Sections rendered into <main>, in this order; all others go to <aside>
+MAIN_KEYS = ("Definition", "Broader", "Narrower", "Related")
+MAIN_KEY_SET = frozenset(MAIN_KEYS)
+# Section headings for the known headers, built once; other aside headers are formatted as met
+H2_TAGS = {header: f"<h2>{header}</h2>\n" for header in HEADER_SPEC}
+
+# --- PRECOMPILED PATTERNS ---
+WIKI_RE = re.compile(r'\[\[(.*?)\]\]')
+# Wiki link or (non-image) markdown link, so a line is scanned once for both
+LINK_RE = re.compile(r'\[\[(?P<wiki>.*?)\]\]|(?<!\!)\[(?P<label>[^\]]+)\]\((?P<url>[^)]+)\)')
+# H1 header line; used with split() so the captured titles interleave with section bodies
+H1_RE = re.compile(r'^#[^\S\n]+(.*)$', re.MULTILINE)
+# Classifies each line of a section body: bullet item, '##' sub-heading, or paragraph
+LINE_RE = re.compile(r'^(?:[-*+][^\S\n]+(?P<item>.*)|#{2,}[^\S\n]*(?P<heading>.*)|(?P<para>.+))$', re.MULTILINE)
+FRONTMATTER_RE = re.compile(r'\A---[ \t]*\r?\n(.*?)^---[ \t]*\r?$\n?', re.DOTALL | re.MULTILINE)
+META_LINE_RE = re.compile(r'^([\w-]+):[ \t]*(.*?)[ \t]*$', re.MULTILINE)
+# Escapes a double-quoted attribute value in one C-level pass
+ATTR_ESCAPE = str.maketrans({'&': '&amp;', '"': '&quot;', '<': '&lt;', '>': '&gt;'})
+
+# --- TEMPLATES ---
+# One shared Environment for the concept pages and the scheme page.
+# Templates don't change mid-build: skip staleness checks and never evict.
+# Compiled bytecode is kept in the temp dir, so each pool worker (and each later
+# run) skips lexing and parsing; Jinja recompiles when a template's source changes.
+# Block tags sit on their own lines, so a template's indentation is the page's.
+TEMPLATE_ENV = Environment(
+    loader=FileSystemLoader(str(TEMPLATE_DIR)),
+    bytecode_cache=FileSystemBytecodeCache(),
+    auto_reload=False,
+    cache_size=-1,
+    trim_blocks=True,
+    lstrip_blocks=True,
+    keep_trailing_newline=True
+)
+
 # --- GLOBAL INDEX ---
-# Stores { "concept title": "uuid" } for link resolution
+# Stores { normalize_title("concept title"): "uuid" } for link resolution
 concept_index = {}
 
+def dump_json(data):
+    """Pretty-prints JSON-LD with a 2-space indent, keeping non-ASCII text as-is."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2, ensure_ascii=False, separators=(",", ": "))
+
 def get_files():
-    """Yields all markdown files in the source directory."""
-    return Path(SOURCE_DIR).glob("*.md")
+    """
+    Yields (path, stem) for every markdown file in the source directory.
+    A single scandir pass; no Path objects or per-entry stat on regular files.
+    """
+    with os.scandir(SOURCE_DIR) as entries:
+        for entry in entries:
+            if entry.name.endswith(".md") and entry.is_file():
+                yield entry.path, entry.name[:-3]
 
+def fast_load(file_path):
+    """
+    Reads a note and returns (metadata, content) without a full YAML parse.
+    Only flat 'key: value' lines are picked up (concept-key, top-concept);
+    surrounding quotes are dropped and nested YAML is ignored.
+    """
+    with open(file_path, encoding="utf-8") as f:
+        data = f.read()
+    match = FRONTMATTER_RE.match(data)
+    if not match:
+        return {}, data
+    metadata = {key: value.strip('\'"') for key, value in META_LINE_RE.findall(match.group(1))}
+    return metadata, data[match.end():]
+
+def normalize_title(text):
+    """Key used for concept_index: NFKC-normalized and casefolded, so Unicode titles match reliably."""
+    return unicodedata.normalize("NFKC", text.strip()).casefold()
+
+@functools.lru_cache(maxsize=4096)
 def clean_link_text(text):
-    """Extracts text from [[Link]] or returns raw text."""
-    match = re.search(r'\[\[(.*?)\]\]', text)
+    """Extracts text from [[Link]] or returns raw text. Cached: the same lines recur across notes."""
+    match = WIKI_RE.search(text)
     return match.group(1) if match else text.strip()
 
+@functools.lru_cache(maxsize=4096)
+def _resolve_wiki_link(inner):
+    """
+    Maps the inside of a [[Target|Label]] link to (target UUID or None, label).
+    Cached per raw link text; cleared whenever concept_index is rebuilt.
+    """
+    target, sep, label = inner.partition('|')
+    return concept_index.get(normalize_title(target)), (label if sep else inner)
+
 # --- HELPER: Centralized Link Processing ---
+@functools.lru_cache(maxsize=8192)
 def process_text_links(text):
     """
     1. Replaces [[Target]] with <a class="internal-link"> (Same Tab)
     2. Replaces [Label](URL) with <a class="external-link" target="_blank"> (New Tab)
+    Cached per input line, since the same link lines recur across notes;
+    cleared together with _resolve_wiki_link whenever concept_index changes.
     """
+    # Both link forms need a '[', and most prose lines have none
+    if '[' not in text:
+        return text
     
-    # --- 1. Internal Wiki Links (Same Tab) ---
-    def wiki_link_sub(match):
-        inner = match.group(1)
-        if '|' in inner:
-            target_text, label_text = inner.split('|', 1)
-        else:
-            target_text = inner
-            label_text = inner
-            
-        target_clean = target_text.strip().lower()
-        target_uuid = concept_index.get(target_clean)
-        
-        if target_uuid:
-            # Absolute path to the directory (matches the JSON-LD ID)
-            return f'<a href="/{VERSION}/{target_uuid}/" class="internal-link">{label_text}</a>'                    
-        else:
-            return label_text
-
-    text = re.sub(r'\[\[(.*?)\]\]', wiki_link_sub, text)
-
-    # --- 2. External Markdown Links (New Tab) ---
-    def md_link_sub(match):
-        label = match.group(1)
-        url = match.group(2)
-        return f'<a href="{url}" class="external-link" target="_blank" rel="noopener noreferrer">{label}</a>'
-
-    # Regex excludes images starting with !
-    text = re.sub(r'(?<!\!)\[([^\]]+)\]\(([^)]+)\)', md_link_sub, text)
-
-    return text 
-
-class SmartHTMLFormatter(HTMLParser):
-    def __init__(self, indent_width=2):
-        super().__init__()
-        self.indent_width = indent_width
-        self.level = 0
-        self.formatted = []
+    def link_sub(match):
+        inner = match.group('wiki')
         
-        self.structural_tags = {
-            'html', 'head', 'body', 'header', 'footer', 'main', 'aside', 
-            'section', 'div', 'ul', 'ol', 'script', 'style', 'meta', 'link'
-        }
-        
-        self.content_tags = {
-            'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'li', 'title', 'blockquote', 'small'
-        }
-        
-        self.void_tags = {'meta', 'link', 'img', 'br', 'hr', 'input'}
-        self.just_opened_block = False
-
-    def _add_newline_if_needed(self):
-        if self.formatted and not self.formatted[-1].endswith('\n'):
-            self.formatted.append('\n')
-
-    def _indent(self):
-        self.formatted.append(' ' * (self.level * self.indent_width))
-
-    def handle_starttag(self, tag, attrs):
-        if tag in self.structural_tags:
-            self._add_newline_if_needed()
-            self._indent()
-            attr_str = ''.join(f' {k}="{v}"' if v else f' {k}' for k, v in attrs)
-            self.formatted.append(f"<{tag}{attr_str}>")
-            if tag not in self.void_tags:
-                self.level += 1
-                self.just_opened_block = True
-
-        elif tag in self.content_tags:
-            self._add_newline_if_needed()
-            self._indent()
-            attr_str = ''.join(f' {k}="{v}"' if v else f' {k}' for k, v in attrs)
-            self.formatted.append(f"<{tag}{attr_str}>")
-            self.just_opened_block = True
+        # --- 1. Internal Wiki Links (Same Tab) ---
+        if inner is not None:
+            target_uuid, label_text = _resolve_wiki_link(inner)
             
-        else:
-            attr_str = ''.join(f' {k}="{v}"' if v else f' {k}' for k, v in attrs)
-            self.formatted.append(f"<{tag}{attr_str}>")
-            self.just_opened_block = False
-
-    def handle_endtag(self, tag):
-        if tag in self.structural_tags:
-            if tag not in self.void_tags:
-                self.level -= 1
-                self._add_newline_if_needed()
-                self._indent()
-            self.formatted.append(f"</{tag}>")
-            self.just_opened_block = False
-
-        elif tag in self.content_tags:
-            if self.formatted and self.formatted[-1].endswith('\n'):
-                 self._indent()
-            self.formatted.append(f"</{tag}>")
-            self.just_opened_block = False
-
-        else:
-            self.formatted.append(f"</{tag}>")
+            if target_uuid:
+                # Absolute path to the directory (matches the JSON-LD ID)
+                return f'<a href="{INTERNAL_LINK_PREFIX}{target_uuid}/" class="internal-link">{label_text}</a>'
+            else:
+                return label_text
 
-    def handle_data(self, data):
-        stripped = data.strip()
-        if not stripped: return
+        # --- 2. External Markdown Links (New Tab) ---
+        label = match.group('label')
+        url = match.group('url')
+        return f'<a href="{url.translate(ATTR_ESCAPE)}" class="external-link" target="_blank" rel="noopener noreferrer">{label}</a>'
 
-        # Safety check: Ensure formatted list is not empty before checking last element
-        if self.just_opened_block and self.formatted and self.formatted[-1].endswith('>'):
-             pass
+    # One scan handles both link forms; the pattern excludes images starting with !
+    return LINK_RE.sub(link_sub, text)
 
-        self.formatted.append(data)
-        self.just_opened_block = False
-    
-    def handle_decl(self, decl):
-        self.formatted.append(f"<!{decl}>\n")
-
-    def handle_comment(self, data):
-        self._add_newline_if_needed()
-        self._indent()
-        self.formatted.append(f"") # Added comment markers for valid HTML
-        
-def prettify_html(html_content):
-    formatter = SmartHTMLFormatter(indent_width=2)
-    formatter.feed(html_content)
-    output = "".join(formatter.formatted)
-    return re.sub(r'\n\s*\n', '\n', output)
-    
 def parse_sections(content):
-    """Splits markdown content by H1 headers."""
-    sections = {}
-    current_header = None
-    lines = content.split('\n')
+    """
+    Splits markdown content by H1 headers.
+    Returns: (main, aside) dicts of {header: stripped lines}, classified by MAIN_KEY_SET
+    """
+    main_sections = {}
+    aside_sections = {}
+    # parts alternates [preamble, header1, body1, header2, body2, ...]
+    parts = H1_RE.split(content)
     
-    for line in lines:
-        header_match = re.match(r'^#\s+(.*)', line)
-        if header_match:
-            current_header = header_match.group(1).strip()
-            sections[current_header] = []
-        elif current_header:
-            if line.strip(): 
-                sections[current_header].append(line.strip())
+    for i in range(1, len(parts), 2):
+        header = parts[i].strip()
+        if not header: continue
+        stripped_lines = (line.strip() for line in parts[i + 1].splitlines())
+        sections = main_sections if header in MAIN_KEY_SET else aside_sections
+        sections[header] = [line for line in stripped_lines if line]
                 
-    return sections
-
-def generate_skos_json(uuid, title, sections):
-    scheme_uri = f"{DOMAIN}/{VERSION}/concept-scheme/"    
+    return main_sections, aside_sections
 
+def generate_skos_json(uuid, title, main_sections, aside_sections):
     json_ld = {
         "@context": {
             "skos": "http://www.w3.org/2004/02/skos/core#",
             "dct": "http://purl.org/dc/terms/"
         },
-        "@id": f"{DOMAIN}/{VERSION}/{uuid}/", 
+        "@id": f"{CONCEPT_URI_PREFIX}{uuid}/", 
         "@type": "skos:Concept",
         "skos:prefLabel": title,
-        "skos:inScheme": scheme_uri
+        "skos:inScheme": SCHEME_URI
     }
 
-    for header, lines in sections.items():
-        skos_prop = HEADER_TO_SKOS.get(header)
-        if not skos_prop or not lines: continue
+    for header, lines in itertools.chain(main_sections.items(), aside_sections.items()):
+        spec = HEADER_SPEC.get(header)
+        if not spec or not lines: continue
+        skos_prop, kind = spec
 
-        if header in ["Broader", "Narrower", "Related"]:
+        if kind == KIND_URIS:
             uris = []
             for line in lines:
-                link_text = clean_link_text(line).lower()
-                target_uuid = concept_index.get(link_text)
+                # Same cached lookup the HTML links use, so [[Target|Label]] resolves too
+                target_uuid = _resolve_wiki_link(clean_link_text(line))[0]
                 if target_uuid:
-                    uris.append(f"{DOMAIN}/{VERSION}/{target_uuid}/")
+                    uris.append(f"{CONCEPT_URI_PREFIX}{target_uuid}/")
             if uris:
                 json_ld[skos_prop] = uris if len(uris) > 1 else uris[0]
 
-        elif header == "Alternative Label":
+        elif kind == KIND_LABELS:
             clean_items = [line.lstrip('- ').strip() for line in lines]
             json_ld[skos_prop] = clean_items
 
@@ -227,69 +228,46 @@ def generate_skos_json(uuid, title, sections):
     return json_ld
 
 def render_section_to_html(lines):
-    html_parts = []
+    """Renders the (already stripped) lines of one section, classifying all of them in one scan."""
+    buf = io.StringIO()
     in_list = False
-    bullet_pattern = re.compile(r'^[-*+]\s+(.*)')
 
-    for line in lines:
-        stripped = line.strip()
-        if not stripped: continue
+    for match in LINE_RE.finditer("\n".join(lines)):
+        kind = match.lastgroup
+        content = process_text_links(match.group(kind))
         
-        bullet_match = bullet_pattern.match(stripped)
+        if kind == 'item':
+            # Opening the list and the item go out in a single write
+            buf.write(f"  <li>{content}</li>\n" if in_list else f"<ul>\n  <li>{content}</li>\n")
+            in_list = True
+            continue
+
+        close = "</ul>\n" if in_list else ""
+        in_list = False
         
-        if bullet_match:
-            if not in_list:
-                html_parts.append("<ul>")
-                in_list = True
-            raw_content = bullet_match.group(1)
-            content = process_text_links(raw_content)
-            html_parts.append(f"<li>{content}</li>")
-
-        elif stripped.startswith('##'):
-            if in_list:
-                html_parts.append("</ul>")
-                in_list = False
-            content = stripped.lstrip('#').strip()
-            content = process_text_links(content)
-            html_parts.append(f"<h3>{content}</h3>")
-
+        if kind == 'heading':
+            buf.write(f"{close}<h3>{content}</h3>\n")
         else:
-            if in_list:
-                html_parts.append("</ul>")
-                in_list = False
-            content = process_text_links(stripped)
-            html_parts.append(f"<p>{content}</p>")
+            buf.write(f"{close}<p>{content}</p>\n")
             
     if in_list:
-        html_parts.append("</ul>")
-        
-    return "\n".join(html_parts)    
-    
-def render_html_main(sections):
-    html_parts = []
-    main_keys = ["Definition", "Broader", "Narrower", "Related"]
+        buf.write("</ul>\n")
     
-    for header in main_keys:
-        lines = sections.get(header)
-        if not lines: continue
-        html_parts.append(f"<h2>{header}</h2>")
-        section_html = render_section_to_html(lines)
-        html_parts.append(section_html)
-            
-    return "\n".join(html_parts)    
+    # Every fragment ends in a newline; drop the last so sections join cleanly
+    return buf.getvalue()[:-1]
     
-def render_html_aside(sections):
-    html_parts = []
-    main_keys = ["Definition", "Broader", "Narrower", "Related"]
-    
-    for header, lines in sections.items():
-        if not lines: continue
-        if header in main_keys: continue 
-        html_parts.append(f"<h2>{header}</h2>")
-        section_html = render_section_to_html(lines)
-        html_parts.append(section_html)
-        
-    return "\n".join(html_parts)
+def render_html_split(main_sections, aside_sections):
+    """Renders the sections from parse_sections into (main, aside) HTML fragments."""
+    # <main> keeps its fixed order regardless of the order in the note
+    main_parts = [
+        H2_TAGS[header] + render_section_to_html(main_sections[header])
+        for header in MAIN_KEYS if main_sections.get(header)
+    ]
+    aside_parts = [
+        (H2_TAGS.get(header) or f"<h2>{header}</h2>\n") + render_section_to_html(lines)
+        for header, lines in aside_sections.items() if lines
+    ]
+    return "\n".join(main_parts), "\n".join(aside_parts)
 
 def generate_concept_scheme(all_concepts, output_dir, version="0.0.1"):
     """Generates the root index.html containing the SKOS ConceptScheme."""
@@ -347,12 +325,10 @@ def generate_concept_scheme(all_concepts, output_dir, version="0.0.1"):
     }
 
     # 3. Render Template
-    json_ld_script = json.dumps(scheme_data, indent=2)
-    template_path = Path(TEMPLATE_DIR) 
-    env = Environment(loader=FileSystemLoader(str(template_path)))
+    json_ld_script = dump_json(scheme_data)
     
     try:
-        template = env.get_template('skos_scheme.html')
+        template = TEMPLATE_ENV.get_template('skos_scheme.html')
         
         output_html = template.render(
             json_ld_script=json_ld_script,
@@ -366,105 +342,241 @@ def generate_concept_scheme(all_concepts, output_dir, version="0.0.1"):
         
         output_file = scheme_dir / "index.html"
         
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(output_html)
+        # Same as the concept pages: encode once, no text-layer wrapper
+        output_file.write_bytes(output_html.encode("utf-8"))
             
         print(f"✅ Generated ConceptScheme at {output_file} with {len(jsonld_links)} top concepts.")
         
     except Exception as e:
         print(f"❌ Error generating index.html: {e}")
 
-def pass_one_index_uuids():
-    """Scans all files to build a map of 'Title -> UUID'."""
-    print("--- Building Index ---")
+def _load_post(file):
+    """Reads one (path, stem) note. Top-level so worker processes can pickle it."""
+    file_path, stem = file
+    try:
+        metadata, content = fast_load(file_path)
+        return file_path, stem, metadata, content, None
+    except Exception as e:
+        return file_path, stem, None, None, str(e)
+
+def load_posts():
+    """
+    Reads every note exactly once.
+    Returns: list of (stem, metadata, content), shared by both passes
+    """
+    print("--- Loading Notes ---")
     if not SOURCE_DIR.exists():
         print(f"ERROR: Source directory not found at {SOURCE_DIR}")
-        return
+        return []
 
-    for file_path in get_files():
-        try:
-            post = frontmatter.load(file_path)
-            uuid = post.metadata.get('concept-key')
-            if uuid:
-                title = file_path.stem.lower() 
-                concept_index[title] = uuid
-        except Exception as e:
-            print(f"Error indexing {file_path}: {e}")
+    posts = []
+
+    # Notes are read independently, so spread the reads and parsing over all cores
+    with ProcessPoolExecutor() as executor:
+        for file_path, stem, metadata, content, error in executor.map(_load_post, get_files(), chunksize=16):
+            if error:
+                print(f"Error loading {file_path}: {error}")
+                continue
+            posts.append((stem, metadata, content))
+    return posts
+
+def pass_one_index_uuids(posts):
+    """Builds the map of 'Title -> UUID' from the loaded notes."""
+    print("--- Building Index ---")
+    for stem, metadata, _ in posts:
+        uuid = metadata.get('concept-key')
+        if uuid:
+            concept_index[normalize_title(stem)] = uuid
+
+    # Cached link lookups may predate this index
+    _resolve_wiki_link.cache_clear()
+    process_text_links.cache_clear()
+
+# Per-worker state for pass two, set up once by _init_page_worker
+render_page = None
+
+def _init_page_worker(index):
+    """Hands each worker the finished index and its own compiled template."""
+    global concept_index, render_page
+    concept_index = index
+    _resolve_wiki_link.cache_clear()
+    process_text_links.cache_clear()
+    # Bind the per-build constants once
+    render_page = functools.partial(TEMPLATE_ENV.get_template("skos_concept.html").render, version=VERSION)
+
+def _render_page(post):
+    """Builds one concept page as UTF-8 bytes. Top-level so worker processes can pickle it."""
+    title, uuid, content, _ = post
+    try:
+        main_sections, aside_sections = parse_sections(content)
+        
+        skos_data = generate_skos_json(uuid, title, main_sections, aside_sections)
+        html_main, html_aside = render_html_split(main_sections, aside_sections)
+        
+        final_html = render_page(
+            title=title,
+            html_main_content=html_main,
+            html_aside_content=html_aside,
+            json_ld=dump_json(skos_data),
+            uuid=uuid
+        )
+        
+        # Encode once here so the writer can hand the bytes straight to the file
+        return title, uuid, final_html.encode("utf-8"), None
+    except Exception as e:
+        return title, uuid, None, str(e)
+
+def _write_page(target_file, data):
+    """Writes one rendered page; returns an error message or None."""
+    try:
+        target_file.write_bytes(data)
+    except Exception as e:
+        return str(e)
 
-def pass_two_build_site_and_collect():
+def _build_fingerprint():
+    """
+    Hashes everything besides a note's own text that shows up in its page:
+    the version, the concept template, this script, and every resolvable link.
+    """
+    parts = [
+        VERSION,
+        str((TEMPLATE_DIR / "skos_concept.html").stat().st_mtime_ns),
+        str(Path(__file__).stat().st_mtime_ns),
+        json.dumps(sorted(concept_index.items()))
+    ]
+    return hashlib.sha1("\0".join(parts).encode("utf-8")).hexdigest()
+
+def _page_digest(title, uuid, content):
+    return hashlib.sha1(f"{title}\0{uuid}\0{content}".encode("utf-8")).hexdigest()
+
+def _load_build_cache(cache_file):
+    """Returns {'fingerprint': str, 'pages': {uuid: digest}}; empty if missing or unreadable."""
+    try:
+        cache = json.loads(cache_file.read_text(encoding="utf-8"))
+        if isinstance(cache.get("pages"), dict):
+            return cache
+    except (OSError, ValueError, AttributeError):
+        pass
+    return {"fingerprint": None, "pages": {}}
+
+def pass_two_build_site_and_collect(posts):
     """
     Generates HTML pages AND collects data for the Concept Scheme.
+    Uses the posts from load_posts instead of re-reading the files.
+    Pages whose note, template, script and link targets are unchanged since the
+    last build (per OUTPUT_DIR/.build_cache.json) are left as they are.
     Returns: list of dicts {filename, frontmatter, content}
     """
     print("--- Generating Site & Collecting Data ---")
     
-    env = Environment(loader=FileSystemLoader(str(TEMPLATE_DIR)))
+    # Fail early here rather than once per worker
     try:
-        template = env.get_template("skos_concept.html")
+        TEMPLATE_ENV.get_template("skos_concept.html")
     except Exception as e:
         print(f"CRITICAL: Could not load 'skos_concept.html' template: {e}")
         return []
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     
+    cache_file = OUTPUT_DIR / BUILD_CACHE_NAME
+    cache = _load_build_cache(cache_file)
+    fingerprint = _build_fingerprint()
+    # A changed template, script or index can touch any page, so nothing carries over
+    cached_pages = cache["pages"] if cache["fingerprint"] == fingerprint else {}
+    built_pages = {}
+    
     all_concepts_data = []
+    # { uuid: (stem, content) } -- one page per concept-key, the last note wins as it always did
+    notes_by_uuid = {}
     
-    for file_path in get_files():
+    for stem, metadata, content in posts:
+        uuid = metadata.get('concept-key')
+        
+        # Save data for Scheme generation later
+        note_data = {
+            'filename': f"{stem}.md",
+            'frontmatter': metadata,
+            'content': content
+        }
+        all_concepts_data.append(note_data)
+
+        if not uuid: 
+            continue # Skip HTML generation if no UUID
+        
+        # Two writers must never share a target file, so duplicates are dropped here
+        if uuid in notes_by_uuid:
+            print(f"⚠️ Warning: {notes_by_uuid[uuid][0]}.md and {stem}.md share concept-key {uuid}; using {stem}.md")
+        notes_by_uuid[uuid] = (stem, content)
+
+    pages = []
+    unchanged = 0
+    for uuid, (stem, content) in notes_by_uuid.items():
+        digest = _page_digest(stem, uuid, content)
+        if cached_pages.get(uuid) == digest and (OUTPUT_DIR / uuid / "index.html").exists():
+            built_pages[uuid] = digest
+            unchanged += 1
+        else:
+            pages.append((stem, uuid, content, digest))
+
+    # Create every missing concept directory up front so the writers only write files;
+    # on a rebuild most already exist, and one scandir replaces a mkdir per page
+    with os.scandir(OUTPUT_DIR) as entries:
+        # { name: is_dir } -- a non-directory in a concept's place can't be reused
+        existing = {entry.name: entry.is_dir() for entry in entries}
+    stems = {uuid: stem for stem, uuid, _, _ in pages}
+    failed = set()
+    for uuid in sorted(uuid for uuid in stems if not existing.get(uuid)):
+        # A bad concept-key only costs its own page, as with render errors
+        if uuid in existing:
+            print(f"Error processing {stems[uuid]}.md: {OUTPUT_DIR / uuid} exists and is not a directory")
+            failed.add(uuid)
+            continue
         try:
-            post = frontmatter.load(file_path)
-            uuid = post.metadata.get('concept-key')
-            
-            # Save data for Scheme generation later
-            note_data = {
-                'filename': file_path.name,
-                'frontmatter': post.metadata,
-                'content': post.content
-            }
-            all_concepts_data.append(note_data)
+            (OUTPUT_DIR / uuid).mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            print(f"Error processing {stems[uuid]}.md: {e}")
+            failed.add(uuid)
+    if failed:
+        # Neither rendered nor recorded in the build cache
+        pages = [page for page in pages if page[1] not in failed]
+
+    # concept_index is frozen now, so every page renders independently;
+    # ship the index to each worker once instead of with every task.
+    # Writes go to a thread pool so disk latency overlaps with rendering.
+    writes = []
+    digests = {uuid: digest for _, uuid, _, digest in pages}
+    with ProcessPoolExecutor(initializer=_init_page_worker, initargs=(concept_index,)) as executor, \
+            ThreadPoolExecutor(max_workers=16) as writer:
+        for title, uuid, data, error in executor.map(_render_page, pages, chunksize=16):
+            if error:
+                print(f"Error processing {title}.md: {error}")
+                continue
+            writes.append((title, uuid, writer.submit(_write_page, OUTPUT_DIR / uuid / "index.html", data)))
+
+    for title, uuid, write in writes:
+        error = write.result()
+        if error:
+            print(f"Error processing {title}.md: {error}")
+        else:
+            built_pages[uuid] = digests[uuid]
 
-            if not uuid: 
-                continue # Skip HTML generation if no UUID
-            
-            # --- HTML GENERATION LOGIC ---
-            title = file_path.stem 
-            sections = parse_sections(post.content)
-            
-            skos_data = generate_skos_json(uuid, title, sections)
-            html_main = render_html_main(sections)
-            html_aside = render_html_aside(sections)
-            
-            raw_html = template.render(
-                title=title,
-                html_main_content=html_main,
-                html_aside_content=html_aside,
-                json_ld=json.dumps(skos_data, indent=2),
-                uuid=uuid,
-                version=VERSION
-            )
-            
-            final_html = prettify_html(raw_html)
-            
-            concept_dir = OUTPUT_DIR / uuid
-            concept_dir.mkdir(parents=True, exist_ok=True)
-            target_file = concept_dir / "index.html"
-            
-            with open(target_file, "w", encoding="utf-8") as f:
-                f.write(final_html) 
-                
-        except Exception as e:
-            print(f"Error processing {file_path.name}: {e}")
+    try:
+        cache_file.write_text(json.dumps({"fingerprint": fingerprint, "pages": built_pages}), encoding="utf-8")
+    except OSError as e:
+        print(f"Warning: could not write build cache {cache_file}: {e}")
             
-    print(f"Build Complete. Files written to {OUTPUT_DIR}")
+    print(f"Build Complete. {len(built_pages) - unchanged} pages rendered, {unchanged} unchanged. Files written to {OUTPUT_DIR}")
     return all_concepts_data
 
 def main():
     print(f"📂 Scanning files in {SOURCE_DIR}...")
     
-    # 1. Build the Global Index (Required for linking)
-    pass_one_index_uuids()
+    # 1. Read every note once and build the Global Index (Required for linking)
+    posts = load_posts()
+    pass_one_index_uuids(posts)
     
     # 2. Generate Pages and Collect Data (Single Pass)
-    all_concepts = pass_two_build_site_and_collect()
+    all_concepts = pass_two_build_site_and_collect(posts)
     
     # 3. Generate the Scheme Index (Using collected data)
     if all_concepts:
@@ -1,6 +1,5 @@
 import os
 import http.server
-import socketserver
 import functools
 from pathlib import Path
 
@@ -21,10 +20,11 @@ def serve():
     os.chdir(SITE_ROOT)
     
     Handler = functools.partial(http.server.SimpleHTTPRequestHandler, directory=".")
-    socketserver.TCPServer.allow_reuse_address = True
+    http.server.ThreadingHTTPServer.allow_reuse_address = True
 
     try:
-        with socketserver.TCPServer(("", PORT), Handler) as httpd:
+        # One thread per connection, so a page's CSS and font requests load in parallel
+        with http.server.ThreadingHTTPServer(("", PORT), Handler) as httpd:
             print(f"\n--- Vernacular Cloud Dev Server ---")
             print(f"    URL:  http://localhost:{PORT}/0.0.1/")
             print(f"    Root: {SITE_ROOT}")